@@ -178,9 +178,30 @@ function buildAmzHeaders(includeUserEmail) {
   return headers;
 }
 
-/** Rate-limit pause — 2100ms ensures < 0.5 req/sec */
-function rateLimitPause() {
-  Utilities.sleep(2100);
+// Adaptive pacing state for the current execution. The floor (2100ms,
+// < 0.5 req/sec) is Amazon's documented rate limit and is never undercut;
+// throttle/server errors grow the delay with decorrelated jitter so a
+// struggling API gets breathing room instead of a fixed-cadence hammering.
+const RATE_LIMIT_FLOOR_MS = 2100;
+const RATE_LIMIT_CAP_MS = 30000;
+let _rateLimitDelayMs = RATE_LIMIT_FLOOR_MS;
+
+/**
+ * Rate-limit pause. Sleeps the floor while calls succeed; on a 429/5xx
+ * grows the sleep exponentially (with jitter) up to a 30s cap, then
+ * decays back toward the floor on the next clean response.
+ * @param {number} [responseCode] - HTTP code from the call just made
+ */
+function rateLimitPause(responseCode) {
+  if (responseCode === 429 || responseCode >= 500) {
+    _rateLimitDelayMs = Math.min(
+      RATE_LIMIT_CAP_MS,
+      RATE_LIMIT_FLOOR_MS + Math.random() * _rateLimitDelayMs * 3
+    );
+  } else {
+    _rateLimitDelayMs = Math.max(RATE_LIMIT_FLOOR_MS, _rateLimitDelayMs / 2);
+  }
+  Utilities.sleep(Math.round(_rateLimitDelayMs));
 }
 
 /** Generate a simple request ID for logging */
@@ -382,7 +403,7 @@ function placeAmazonOrder(cartItems, transactionId, requesterName, requesterEmai
     }
   }
 
-  rateLimitPause();
+  rateLimitPause(code);
 
   if (code === 500 && CONFIG.AMAZON_B2B.TRIAL_MODE_ENABLED) {
     // In TRIAL MODE only: simulate success on 500 to allow E2E testing when Amazon API is unavailable
@@ -908,11 +929,9 @@ class AmazonWorkflowEngine {
 
   extractASIN(url) {
     if (!url) return null;
-    for (const pattern of CONFIG.ASIN_PATTERNS) {
-      const match = url.match(pattern);
-      if (match && match[1]) return match[1].toUpperCase();
-    }
-    return null;
+    const match = url.match(CONFIG.ASIN_PATTERN_SPECIFIC) ||
+      url.match(CONFIG.ASIN_PATTERN_FALLBACK);
+    return match && match[1] ? match[1].toUpperCase() : null;
   }
 
   updateQueueItemStatus(queueId, status) {
@@ -120,13 +120,12 @@ const CONFIG = {
   // Amazon user email for x-amz-user-email header
   AMZ_USER_EMAIL: getDyn("AMZ_USER_EMAIL", "mtrotter@keswickchristian.org"),
 
-  ASIN_PATTERNS: [
-    /\/dp\/([A-Z0-9]{10})/i,
-    /\/gp\/product\/([A-Z0-9]{10})/i,
-    /\/product\/([A-Z0-9]{10})/i,
-    /[?&]asin=([A-Z0-9]{10})/i,
-    /\/([A-Z0-9]{10})(?:[/?#]|$)/i,
-  ],
+  // Specific ASIN URL shapes combined into one alternation — a single
+  // scan of the URL instead of one match() per pattern. The generic
+  // trailing-token pattern stays separate as a fallback so it can never
+  // shadow a specific match.
+  ASIN_PATTERN_SPECIFIC: /(?:\/dp\/|\/gp\/product\/|\/product\/|[?&]asin=)([A-Z0-9]{10})/i,
+  ASIN_PATTERN_FALLBACK: /\/([A-Z0-9]{10})(?:[/?#]|$)/i,
 
   // Request Rate Limiting
   REQUEST_DELAY_MIN_MS: 10000, // 10 seconds minimum
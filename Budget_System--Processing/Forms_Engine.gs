@@ -548,15 +548,35 @@ function processAmazonFormSubmission(e) {
 // WAREHOUSE FORM PROCESSING
 // ============================================================================
 
+// Catalog caching: a submission with 5 items used to open the Automated Hub
+// and scan the full WarehouseCatalog sheet 5 times. The catalog is loaded once
+// per execution and kept in CacheService with a TTL so back-to-back
+// submissions skip the sheet read entirely. Prices move slowly; a 30-minute
+// TTL keeps admin edits from being stale for long.
+let _warehouseCatalogMap = null;
+const WAREHOUSE_CATALOG_CACHE_KEY = "warehouse_catalog_v1";
+const WAREHOUSE_CATALOG_TTL_SECONDS = 1800;
+
 /**
- * Looks up a warehouse catalog item by stock number.
- * Reads from the WarehouseCatalog sheet in the Automated Hub.
- * Columns: A=Stock Number, B=Item Description, C=Price, D=UOM, E=Category
+ * Loads the WarehouseCatalog sheet into a stock-number-keyed map.
+ * Memoized per execution and cached across executions via CacheService.
  *
- * @param {string} stockNumber - The catalog stock number to look up
- * @returns {Object|null} { description, unitPrice, uom, category } or null if not found
+ * @returns {Object|null} Map of normalized stock number -> item, or null
  */
-function lookupWarehouseCatalogItem(stockNumber) {
+function getWarehouseCatalogMap() {
+  if (_warehouseCatalogMap) return _warehouseCatalogMap;
+
+  const cache = CacheService.getScriptCache();
+  try {
+    const cached = cache.get(WAREHOUSE_CATALOG_CACHE_KEY);
+    if (cached) {
+      _warehouseCatalogMap = JSON.parse(cached);
+      return _warehouseCatalogMap;
+    }
+  } catch (cacheErr) {
+    console.warn(`⚠️ Catalog cache read failed: ${cacheErr.message}`);
+  }
+
   const autoHub = SpreadsheetApp.openById(CONFIG.AUTOMATED_HUB_ID);
   const catalog = autoHub.getSheetByName("WarehouseCatalog");
   if (!catalog) {
@@ -565,21 +585,46 @@ function lookupWarehouseCatalogItem(stockNumber) {
   }
 
   const data = catalog.getDataRange().getValues();
-  const normalizedId = String(stockNumber).trim().toUpperCase();
-
+  const map = {};
   for (let i = 1; i < data.length; i++) {
-    if (String(data[i][0]).trim().toUpperCase() === normalizedId) {
-      return {
-        description: String(data[i][1] || ""),
-        unitPrice: parseFloat(String(data[i][2]).replace(/[$,]/g, "")) || 0,
-        uom: String(data[i][3] || ""),
-        category: String(data[i][4] || ""),
-      };
-    }
+    const id = String(data[i][0]).trim().toUpperCase();
+    if (!id) continue;
+    map[id] = {
+      description: String(data[i][1] || ""),
+      unitPrice: parseFloat(String(data[i][2]).replace(/[$,]/g, "")) || 0,
+      uom: String(data[i][3] || ""),
+      category: String(data[i][4] || ""),
+    };
   }
 
-  console.warn(`⚠️ Catalog item not found: ${stockNumber}`);
-  return null;
+  _warehouseCatalogMap = map;
+  try {
+    cache.put(WAREHOUSE_CATALOG_CACHE_KEY, JSON.stringify(map), WAREHOUSE_CATALOG_TTL_SECONDS);
+  } catch (cacheErr) {
+    // Catalog may exceed the 100KB CacheService limit — the per-execution
+    // memo above still covers multi-item submissions.
+    console.warn(`⚠️ Catalog cache write skipped: ${cacheErr.message}`);
+  }
+  return map;
+}
+
+/**
+ * Looks up a warehouse catalog item by stock number.
+ * Reads from the cached WarehouseCatalog map (see getWarehouseCatalogMap).
+ * Columns: A=Stock Number, B=Item Description, C=Price, D=UOM, E=Category
+ *
+ * @param {string} stockNumber - The catalog stock number to look up
+ * @returns {Object|null} { description, unitPrice, uom, category } or null if not found
+ */
+function lookupWarehouseCatalogItem(stockNumber) {
+  const map = getWarehouseCatalogMap();
+  if (!map) return null;
+
+  const item = map[String(stockNumber).trim().toUpperCase()] || null;
+  if (!item) {
+    console.warn(`⚠️ Catalog item not found: ${stockNumber}`);
+  }
+  return item;
 }
 
 function processWarehouseFormSubmission(e) {
@@ -423,49 +423,39 @@ function testProjectSeparation() {
 function testCrossProjectCommunication() {
   console.log('=== Testing Cross-Project Communication ===');
   const results = [];
-  
-  // Test Dashboard API
-  try {
-    const dashboardHealth = UrlFetchApp.fetch(`${TEST_CONFIG.PROJECT_ENDPOINTS.DASHBOARD}/health`, {
-      muteHttpExceptions: true,
-      timeout: 5000
-    });
-    
-    results.push({
-      test: 'Dashboard Health Check',
-      passed: dashboardHealth.getResponseCode() === 200,
-      expected: 200,
-      actual: dashboardHealth.getResponseCode()
-    });
-  } catch (error) {
-    results.push({
-      test: 'Dashboard Health Check',
-      passed: false,
-      error: error.message
-    });
-  }
-  
-  // Test Invoicing API
+
+  // Both health checks go out in one fetchAll so the slower endpoint sets
+  // the wall time instead of the two waits stacking up.
+  const checks = [
+    { test: 'Dashboard Health Check', endpoint: TEST_CONFIG.PROJECT_ENDPOINTS.DASHBOARD },
+    { test: 'Invoicing Health Check', endpoint: TEST_CONFIG.PROJECT_ENDPOINTS.INVOICING }
+  ];
+
   try {
-    const invoicingHealth = UrlFetchApp.fetch(`${TEST_CONFIG.PROJECT_ENDPOINTS.INVOICING}/health`, {
+    const responses = UrlFetchApp.fetchAll(checks.map(check => ({
+      url: `${check.endpoint}/health`,
       muteHttpExceptions: true,
       timeout: 5000
-    });
-    
-    results.push({
-      test: 'Invoicing Health Check',
-      passed: invoicingHealth.getResponseCode() === 200,
-      expected: 200,
-      actual: invoicingHealth.getResponseCode()
+    })));
+
+    responses.forEach((response, i) => {
+      results.push({
+        test: checks[i].test,
+        passed: response.getResponseCode() === 200,
+        expected: 200,
+        actual: response.getResponseCode()
+      });
     });
   } catch (error) {
-    results.push({
-      test: 'Invoicing Health Check',
-      passed: false,
-      error: error.message
+    checks.forEach(check => {
+      results.push({
+        test: check.test,
+        passed: false,
+        error: error.message
+      });
     });
   }
-  
+
   return results;
 }
 
@@ -42,21 +42,14 @@ function getCurrentQuarter() {
 
 function extractASIN(url) {
   if (!url) return null;
-  
-  const patterns = CONFIG.ASIN_PATTERNS || [
-    /\/dp\/([A-Z0-9]{10})/i,
-    /\/gp\/product\/([A-Z0-9]{10})/i,
-    /\/product\/([A-Z0-9]{10})/i,
-    /[?&]asin=([A-Z0-9]{10})/i,
-    /\/([A-Z0-9]{10})(?:[/?#]|$)/i
-  ];
-  
-  for (const pattern of patterns) {
-    const match = url.match(pattern);
-    if (match) return match[1];
-  }
-  
-  return null;
+
+  const specific = CONFIG.ASIN_PATTERN_SPECIFIC ||
+    /(?:\/dp\/|\/gp\/product\/|\/product\/|[?&]asin=)([A-Z0-9]{10})/i;
+  const fallback = CONFIG.ASIN_PATTERN_FALLBACK ||
+    /\/([A-Z0-9]{10})(?:[/?#]|$)/i;
+
+  const match = url.match(specific) || url.match(fallback);
+  return match ? match[1] : null;
 }
 
 function extractPdfLink(uploadResponse) {
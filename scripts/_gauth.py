@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Shared clasp-credential loading for the one-off Google API scripts.
+
+Every script in this directory authenticates with the OAuth token clasp
+stores in ~/.clasprc.json. Loading it here (once per process, cached)
+keeps the parsing logic in one place and refreshes a stale access token
+before the first API call instead of failing mid-batch.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+
+
+@lru_cache(maxsize=1)
+def get_credentials() -> Credentials:
+    """Load clasp's OAuth token as google-auth Credentials.
+
+    Cached for the process lifetime; refreshed up front when expired.
+    Raises FileNotFoundError / KeyError when clasp login hasn't run.
+    """
+    clasp_creds_path = Path.home() / '.clasprc.json'
+    with open(clasp_creds_path) as f:
+        clasp_data = json.load(f)
+
+    token_data = clasp_data['tokens']['default']
+
+    creds = Credentials(
+        token=token_data['access_token'],
+        refresh_token=token_data['refresh_token'],
+        token_uri='https://oauth2.googleapis.com/token',
+        client_id=token_data['client_id'],
+        client_secret=token_data['client_secret']
+    )
+
+    if creds.expired and creds.refresh_token:
+        creds.refresh(Request())
+
+    return creds
+
+
+def get_access_token() -> str:
+    """Bearer token for scripts that hit the REST endpoints directly."""
+    return get_credentials().token
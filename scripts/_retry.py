@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Shared retry/backoff for the one-off Google API scripts.
+
+The Sheets and Drive APIs shed load with 429/5xx responses; a one-shot
+.execute() turns a transient throttle into a failed run. with_retry()
+retries just those statuses with exponential backoff plus jitter and
+lets every other error propagate unchanged.
+"""
+
+import random
+import time
+from typing import Any
+
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+
+def with_retry(request: HttpRequest, max_attempts: int = 5, base_delay: float = 1.0) -> Any:
+    """Execute a googleapiclient request, retrying transient failures.
+
+    Args:
+        request: An unexecuted googleapiclient request object.
+        max_attempts: Total tries before the last error is re-raised.
+        base_delay: First backoff in seconds; doubles per attempt.
+
+    Returns:
+        The executed request's response.
+    """
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return request.execute()
+        except HttpError as e:
+            status = e.resp.status
+            if status not in RETRYABLE_STATUS or attempt == max_attempts:
+                raise
+            delay = base_delay * (2 ** (attempt - 1)) + random.uniform(0, 1)
+            print(f"  ⚠ API returned {status}; retrying in {delay:.1f}s "
+                  f"(attempt {attempt}/{max_attempts})")
+            time.sleep(delay)
@@ -5,25 +5,23 @@ Uses the same OAuth credentials as clasp.
 """
 
 import json
-from pathlib import Path
-from google.oauth2.credentials import Credentials
+from concurrent.futures import ThreadPoolExecutor
 from googleapiclient.discovery import build
 
-def get_credentials():
-    """Load clasp's OAuth token."""
-    clasp_creds_path = Path.home() / '.clasprc.json'
-    with open(clasp_creds_path) as f:
-        clasp_data = json.load(f)
-    
-    token_data = clasp_data['tokens']['default']
-    
-    return Credentials(
-        token=token_data['access_token'],
-        refresh_token=token_data['refresh_token'],
-        token_uri='https://oauth2.googleapis.com/token',
-        client_id=token_data['client_id'],
-        client_secret=token_data['client_secret']
-    )
+from _gauth import get_credentials
+from _retry import with_retry
+
+def col_letter(n):
+    """1-based column number -> A1 letter(s), e.g. 1 -> A, 29 -> AC.
+
+    The old chr(64 + n) shortcut broke past column Z: the Amazon and
+    Warehouse sheets have 29 headers, whose ranges came out as A1:]1.
+    """
+    letters = ''
+    while n > 0:
+        n, rem = divmod(n - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
 
 def create_spreadsheet_with_sheets(sheets_service, title, sheet_configs):
     """Create a spreadsheet with multiple sheets and headers."""
@@ -45,61 +43,78 @@ def create_spreadsheet_with_sheets(sheets_service, title, sheet_configs):
     }
     
     # Create the spreadsheet
-    result = sheets_service.spreadsheets().create(body=spreadsheet).execute()
+    result = with_retry(sheets_service.spreadsheets().create(body=spreadsheet))
     spreadsheet_id = result['spreadsheetId']
     
-    # Add headers to each sheet
+    # Add headers to each sheet. Both the header values and the
+    # formatting requests are accumulated and sent as one
+    # values.batchUpdate plus one batchUpdate per hub — two API calls
+    # total instead of two per sheet.
+    header_data = []
+    format_requests = []
     for i, sheet_config in enumerate(sheet_configs):
         sheet_id = result['sheets'][i]['properties']['sheetId']
         sheet_name = sheet_config['name']
         headers = sheet_config['headers']
-        
+
         # Write headers
-        range_name = f"'{sheet_name}'!A1:{chr(64 + len(headers))}1"
-        sheets_service.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range=range_name,
-            valueInputOption='RAW',
-            body={'values': [headers]}
-        ).execute()
-        
+        header_data.append({
+            'range': f"'{sheet_name}'!A1:{col_letter(len(headers))}1",
+            'values': [headers]
+        })
+
         # Bold the header row
-        sheets_service.spreadsheets().batchUpdate(
-            spreadsheetId=spreadsheet_id,
-            body={
-                'requests': [{
-                    'repeatCell': {
-                        'range': {
-                            'sheetId': sheet_id,
-                            'startRowIndex': 0,
-                            'endRowIndex': 1
-                        },
-                        'cell': {
-                            'userEnteredFormat': {
-                                'textFormat': {'bold': True},
-                                'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
-                            }
-                        },
-                        'fields': 'userEnteredFormat(textFormat,backgroundColor)'
-                    }
-                }, {
-                    'updateSheetProperties': {
-                        'properties': {
-                            'sheetId': sheet_id,
-                            'gridProperties': {'frozenRowCount': 1}
-                        },
-                        'fields': 'gridProperties.frozenRowCount'
+        format_requests.extend([{
+            'repeatCell': {
+                'range': {
+                    'sheetId': sheet_id,
+                    'startRowIndex': 0,
+                    'endRowIndex': 1
+                },
+                'cell': {
+                    'userEnteredFormat': {
+                        'textFormat': {'bold': True},
+                        'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
                     }
-                }]
+                },
+                'fields': 'userEnteredFormat(textFormat,backgroundColor)'
             }
-        ).execute()
-    
+        }, {
+            'updateSheetProperties': {
+                'properties': {
+                    'sheetId': sheet_id,
+                    'gridProperties': {'frozenRowCount': 1}
+                },
+                'fields': 'gridProperties.frozenRowCount'
+            }
+        }])
+
+    with_retry(sheets_service.spreadsheets().values().batchUpdate(
+        spreadsheetId=spreadsheet_id,
+        body={'valueInputOption': 'RAW', 'data': header_data}
+    ))
+
+    with_retry(sheets_service.spreadsheets().batchUpdate(
+        spreadsheetId=spreadsheet_id,
+        body={'requests': format_requests}
+    ))
+
     return spreadsheet_id
 
+def create_hub(creds, title, sheet_configs):
+    """Create one hub on its own service client.
+
+    googleapiclient's httplib2 transport is not thread-safe, so each
+    worker thread builds its own service instead of sharing one.
+    """
+    # static_discovery uses the discovery doc bundled with the client
+    # library instead of fetching it over the network on every build()
+    service = build('sheets', 'v4', credentials=creds, static_discovery=True)
+    return create_spreadsheet_with_sheets(service, title, sheet_configs)
+
 def main():
     creds = get_credentials()
-    sheets_service = build('sheets', 'v4', credentials=creds)
-    
+
     print("Creating Hub spreadsheets for Keswick Budget System...")
     print("=" * 60)
     
@@ -131,9 +146,6 @@ def main():
         }
     ]
     
-    budget_hub_id = create_spreadsheet_with_sheets(sheets_service, 'Budget Hub', budget_hub_config)
-    print(f"✅ Budget Hub created: {budget_hub_id}")
-    
     # 2. Automated Hub
     automated_hub_config = [
         {
@@ -168,9 +180,6 @@ def main():
         }
     ]
     
-    automated_hub_id = create_spreadsheet_with_sheets(sheets_service, 'Automated Hub', automated_hub_config)
-    print(f"✅ Automated Hub created: {automated_hub_id}")
-    
     # 3. Manual Hub
     manual_hub_config = [
         {
@@ -197,9 +206,20 @@ def main():
         }
     ]
     
-    manual_hub_id = create_spreadsheet_with_sheets(sheets_service, 'Manual Hub', manual_hub_config)
-    print(f"✅ Manual Hub created: {manual_hub_id}")
-    
+    # The three hubs are independent spreadsheets, so create them
+    # concurrently — the work is almost entirely API wall-time.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        budget_future = pool.submit(create_hub, creds, 'Budget Hub', budget_hub_config)
+        automated_future = pool.submit(create_hub, creds, 'Automated Hub', automated_hub_config)
+        manual_future = pool.submit(create_hub, creds, 'Manual Hub', manual_hub_config)
+
+        budget_hub_id = budget_future.result()
+        print(f"✅ Budget Hub created: {budget_hub_id}")
+        automated_hub_id = automated_future.result()
+        print(f"✅ Automated Hub created: {automated_hub_id}")
+        manual_hub_id = manual_future.result()
+        print(f"✅ Manual Hub created: {manual_hub_id}")
+
     print("\n" + "=" * 60)
     print("SUMMARY - New Spreadsheet IDs for CONFIG:")
     print("=" * 60)
@@ -10,26 +10,20 @@ Block until the user confirms they have logged into all three services.
 """
 
 import os
-from playwright.sync_api import sync_playwright
 from conftest import (
     PROFILE_DIR,
     BUDGET_HUB,
     APPS_SCRIPT_HOME,
     OWA_URL,
 )
+from helpers.browser import close_context, get_playwright, launch_context
 
 
 def main() -> None:
     os.makedirs(PROFILE_DIR, exist_ok=True)
 
-    with sync_playwright() as pw:
-        context = pw.chromium.launch_persistent_context(
-            user_data_dir=PROFILE_DIR,
-            headless=False,
-            viewport={"width": 1280, "height": 900},
-            args=["--disable-blink-features=AutomationControlled"],
-        )
-
+    context = launch_context(get_playwright())
+    try:
         # Tab 1 — Budget Hub
         page1 = context.pages[0] if context.pages else context.new_page()
         page1.goto(BUDGET_HUB, wait_until="domcontentloaded")
@@ -54,7 +48,8 @@ def main() -> None:
         )
 
         print("Login session saved. You can close this script.")
-        context.close()
+    finally:
+        close_context(context)
 
 
 if __name__ == "__main__":
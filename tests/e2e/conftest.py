@@ -53,3 +53,30 @@ APPS_SCRIPT_HOME = "https://script.google.com/a/keswickchristian.org/"
 
 # Evidence directory
 EVIDENCE_DIR = "/Users/mtrotter/budget-system/tests/e2e/evidence"
+
+# ---------------------------------------------------------------------------
+# Pytest fixtures
+# ---------------------------------------------------------------------------
+# Guarded: this module doubles as a plain constants import for the runner
+# and debug scripts, which must not require pytest to be installed.
+try:
+    import pytest
+except ImportError:
+    pytest = None
+
+if pytest is not None:
+
+    @pytest.fixture(scope="session")
+    def browser_context():
+        """One persistent context shared by the whole pytest session.
+
+        Launching the Chrome profile costs ~2-3s; a per-test launch would
+        dominate the runtime of small smoke tests. Session scope also
+        matches the hard constraint that only one instance may use the
+        profile at a time.
+        """
+        from helpers.browser import close_context, get_playwright, launch_context
+
+        context = launch_context(get_playwright())
+        yield context
+        close_context(context)
@@ -1,18 +1,10 @@
-from playwright.sync_api import sync_playwright
-from conftest import PROFILE_DIR, BUDGET_HUB
+from conftest import BUDGET_HUB
+from helpers.browser import close_context, get_playwright, launch_context
 from helpers.sheets import open_sheet, set_cell
-import time
-import os
 
 def run():
-    with sync_playwright() as pw:
-        context = pw.chromium.launch_persistent_context(
-            user_data_dir=PROFILE_DIR,
-            headless=False,
-            channel="chrome",
-            viewport={"width": 1280, "height": 900},
-            args=["--disable-blink-features=AutomationControlled"],
-        )
+    context = launch_context(get_playwright())
+    try:
         page = open_sheet(context, BUDGET_HUB, "UserDirectory")
         set_cell(page, "A1", "Email")
         print("Restored A1 to 'Email'")
@@ -22,9 +14,11 @@ def run():
         set_cell(page, "A2", "invoicing@keswickchristian.org")
         print("Restored A2 to 'invoicing@keswickchristian.org'")
 
-        # Now I should probably test that set_cell works nicely.
-        page.screenshot(path="evidence/sheet_fixed.png", full_page=True)
-        context.close()
+        # Viewport-only shot is plenty to verify A1/A2 — a full-page PNG of
+        # the whole grid costs seconds of encode time and megabytes on disk.
+        page.screenshot(path="evidence/sheet_fixed.png")
+    finally:
+        close_context(context)
 
 if __name__ == "__main__":
     run()
\ No newline at end of file
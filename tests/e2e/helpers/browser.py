@@ -0,0 +1,121 @@
+"""Shared browser launching for E2E scenarios and the suite runner.
+
+Every scenario drives the same persistent Chrome profile, and launching
+that profile is the single most expensive step of a scenario (~2-3s).
+Centralizing the launch here lets the suite runner create ONE context and
+hand it to each scenario instead of relaunching per phase, and keeps the
+launch flags consistent across scripts.
+"""
+
+from __future__ import annotations
+
+import atexit
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Playwright
+
+from conftest import PROFILE_DIR
+
+VIEWPORT = {"width": 1280, "height": 900}
+LAUNCH_ARGS = ["--disable-blink-features=AutomationControlled"]
+# Extra flags for headless runs (inspect/debug scripts): no GPU process,
+# /tmp instead of the small /dev/shm for shared memory, and no profile
+# extensions — none of which a text dump needs.
+HEADLESS_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+]
+
+# Auto-dismiss Google Sheets modal overlays ("Some features have changed",
+# picker dialogs) the moment they attach. Installed once per context at
+# launch, so individual helpers don't need cleanup evaluates before every
+# interaction. Scoped to docs.google.com — OWA and Apps Script pages use
+# their own dialog markup that must stay untouched.
+_DISMISS_SHEETS_MODALS_JS = """
+(() => {
+    if (!location.hostname.endsWith('docs.google.com')) return;
+    const SELECTOR = '.modal-dialog-bg, .modal-dialog, .picker.modal-dialog-bg';
+    const zap = () => document.querySelectorAll(SELECTOR).forEach(el => el.remove());
+    new MutationObserver(zap).observe(document.documentElement, {
+        childList: true,
+        subtree: true,
+    });
+})();
+"""
+
+# Module-shared Playwright driver. Starting the driver spawns a Node
+# process (~1s); scenario chains like D1 -> A1 and the debug scripts
+# should pay that once per Python process, not once per run() call.
+_playwright: Playwright | None = None
+
+
+def get_playwright() -> Playwright:
+    """Start (once) and return the process-wide Playwright driver.
+
+    The driver is stopped automatically at interpreter exit, so callers
+    only manage the contexts they launch from it.
+    """
+    global _playwright
+    if _playwright is None:
+        from playwright.sync_api import sync_playwright
+
+        _playwright = sync_playwright().start()
+        atexit.register(stop_playwright)
+    return _playwright
+
+
+def close_context(context: BrowserContext) -> None:
+    """Close a context, tolerating one that is already closed.
+
+    Playwright raises on a second close(). Teardown paths — runner
+    finally blocks, recycle boundaries, interpreter exit — can overlap
+    with a scenario that already closed its context, and a double close
+    should never mask the original failure.
+    """
+    try:
+        context.close()
+    except Exception:
+        pass
+
+
+def stop_playwright() -> None:
+    """Stop the shared driver if it was started."""
+    global _playwright
+    if _playwright is not None:
+        _playwright.stop()
+        _playwright = None
+
+
+def launch_context(
+    pw: Playwright,
+    *,
+    headless: bool = False,
+    channel: str | None = "chrome",
+) -> BrowserContext:
+    """Launch the shared persistent-profile context.
+
+    Args:
+        pw: A started sync Playwright instance.
+        headless: Run without a visible window (debug scripts only —
+            scenarios need the headed profile for Google/OWA sessions).
+        channel: Browser channel; pass None for bundled Chromium.
+
+    Returns:
+        The persistent BrowserContext.
+    """
+    args = list(LAUNCH_ARGS)
+    if headless:
+        args.extend(HEADLESS_ARGS)
+    kwargs = dict(
+        user_data_dir=PROFILE_DIR,
+        headless=headless,
+        viewport=VIEWPORT,
+        args=args,
+    )
+    if channel:
+        kwargs["channel"] = channel
+    context = pw.chromium.launch_persistent_context(**kwargs)
+    context.add_init_script(_DISMISS_SHEETS_MODALS_JS)
+    return context
@@ -2,16 +2,36 @@
 
 from __future__ import annotations
 
-import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from playwright.sync_api import BrowserContext, Page
 
+from helpers.network import block_heavy_resources
+
+# Text-ish inputs a Google Form renders for open questions
+_TEXT_INPUT_SELECTOR = (
+    "input[type='text'], input[type='number'], textarea, "
+    "input:not([type='hidden']):not([type='submit'])"
+)
+
+# In-page visibility/editability filter: one evaluate instead of two
+# protocol round trips (is_visible + is_editable) per candidate input.
+_EDITABLE_INDICES_JS = """(selector) =>
+    [...document.querySelectorAll(selector)]
+        .map((el, i) => ({ i, ok: el.offsetParent !== null
+            && !el.disabled && !el.readOnly }))
+        .filter(d => d.ok)
+        .map(d => d.i)"""
+
 
 def open_form(context: BrowserContext, form_url: str) -> Page:
     """Open a Google Form in a new tab.
 
+    Waits for the first question container to attach instead of a fixed
+    3s pause — forms are usually interactive well under a second after
+    domcontentloaded, and a flat sleep just pads every scenario.
+
     Args:
         context: Persistent browser context.
         form_url: URL of the Google Form.
@@ -20,8 +40,15 @@ def open_form(context: BrowserContext, form_url: str) -> Page:
         Page with the form loaded.
     """
     page = context.new_page()
+    block_heavy_resources(page)
     page.goto(form_url, wait_until="domcontentloaded")
-    page.wait_for_timeout(3000)
+    try:
+        page.wait_for_selector("[role='listitem'], form", timeout=15000)
+    except Exception:
+        # Fall back to the old fixed pause if the form renders unusually
+        page.wait_for_timeout(3000)
+    # Short settle for the Forms JS to wire up inputs
+    page.wait_for_timeout(500)
     return page
 
 
@@ -35,19 +62,21 @@ def fill_text_fields(page: Page, values: list[str]) -> None:
         page: Page with a Google Form loaded.
         values: List of values to fill, in order of appearance.
     """
-    inputs = page.locator(
-        "input[type='text'], input[type='number'], textarea, "
-        "input:not([type='hidden']):not([type='submit'])"
-    ).all()
-
-    # Filter to only visible, editable inputs within the form
-    editable = [inp for inp in inputs if inp.is_visible() and inp.is_editable()]
-
-    for i, value in enumerate(values):
-        if i < len(editable):
-            editable[i].click()
-            editable[i].fill(str(value))
-            page.wait_for_timeout(200)
+    # One evaluate finds the visible+editable inputs; querySelectorAll and
+    # the locator resolve in the same document order, so the indices line
+    # up with nth().
+    fields = page.locator(_TEXT_INPUT_SELECTOR)
+    editable_indices = page.evaluate(_EDITABLE_INDICES_JS, _TEXT_INPUT_SELECTOR)
+
+    # zip() pairs values with inputs directly — no per-iteration bounds
+    # check — and one settle pause after the loop replaces the 200ms tax
+    # paid per field (~1s on a five-field form). fill() already waits for
+    # each input to be actionable.
+    for idx, value in zip(editable_indices, values):
+        inp = fields.nth(idx)
+        inp.click()
+        inp.fill(str(value))
+    page.wait_for_timeout(200)
 
 
 def fill_amazon_form(
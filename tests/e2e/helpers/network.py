@@ -0,0 +1,41 @@
+"""Request filtering to cut page weight during automation.
+
+Google Forms and OWA pages pull a lot of imagery, fonts, and media the
+tests never look at. Aborting those requests shortens page loads without
+affecting the DOM the helpers read. Stylesheets are deliberately left
+alone — is_visible()/is_editable() checks depend on layout.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Page, Route
+
+# Module-level frozenset: the handler runs once per subresource (easily
+# hundreds per Sheets/Forms page), and an inline set literal would be
+# rebuilt on every invocation.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+
+def _abort_heavy(route: Route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def block_heavy_resources(page: Page) -> None:
+    """Abort image/media/font requests on the given page."""
+    page.route("**/*", _abort_heavy)
+
+
+def block_heavy_resources_on_context(context: BrowserContext) -> None:
+    """Abort image/media/font requests on every page in the context.
+
+    Context-level routing covers tabs the helpers never see (popups,
+    redirect hops, the reset page) with one registration, instead of
+    each open_* helper wiring its own per-page route.
+    """
+    context.route("**/*", _abort_heavy)
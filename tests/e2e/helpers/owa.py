@@ -3,13 +3,29 @@
 from __future__ import annotations
 
 import re
-import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from playwright.sync_api import BrowserContext, Page
 
 from conftest import OWA_URL
+from helpers.network import block_heavy_resources
+
+# Compiled once at import — extract_approval_link runs in every approval
+# scenario and shouldn't pay pattern-cache lookups per call.
+_SCRIPT_URL_RE = re.compile(r"https://script\.google\.com\S+")
+
+# One probe for the open email: the reading-pane text plus every Apps
+# Script href, in a single round trip instead of one per link.
+_EMAIL_PROBE_JS = """() => {
+    const pane = document.querySelector(
+        "[role='document'], .ReadMsgBody, [aria-label*='Message body']");
+    return {
+        body: pane ? pane.innerText : '',
+        hrefs: [...document.querySelectorAll("a[href*='script.google.com']")]
+            .map(a => a.href),
+    };
+}"""
 
 
 def open_owa(context: BrowserContext) -> Page:
@@ -22,8 +38,17 @@ def open_owa(context: BrowserContext) -> Page:
         Page positioned on the OWA inbox.
     """
     page = context.new_page()
+    block_heavy_resources(page)
     page.goto(OWA_URL, wait_until="domcontentloaded")
-    page.wait_for_timeout(5000)
+    # Wait for the message list itself instead of a flat 5s — OWA's shell
+    # renders fast but the list hydrates late, and the list is what every
+    # helper below drives.
+    try:
+        page.wait_for_selector(
+            "div[role='option'], [data-convid]", timeout=15000
+        )
+    except Exception:
+        page.wait_for_timeout(5000)
     return page
 
 
@@ -39,7 +64,13 @@ def search_emails(page: Page, query: str) -> None:
     page.wait_for_timeout(500)
     search_box.fill(query)
     page.keyboard.press("Enter")
-    page.wait_for_timeout(4000)
+    # Wait for a result row to appear rather than a flat 4s; keep a short
+    # settle because OWA repaints the virtualized list as results stream in.
+    try:
+        page.wait_for_selector("div[role='option']", timeout=10000)
+    except Exception:
+        pass
+    page.wait_for_timeout(1000)
 
 
 def open_latest_email(page: Page) -> None:
@@ -87,19 +118,21 @@ def extract_approval_link(page: Page) -> str | None:
     Returns:
         The approval URL string, or None if not found.
     """
-    links = page.locator("a[href*='script.google.com']").all()
-    if links:
-        for link in links:
-            href = link.get_attribute("href")
-            # Prefer 'approve' link over 'reject' if both present
-            if href and "decision=approve" in href:
-                return href
+    # One evaluate fetches the hrefs and the body text together; the old
+    # locator walk paid a get_attribute round trip per link plus another
+    # full body read on the fallback path.
+    probe = page.evaluate(_EMAIL_PROBE_JS)
+
+    for href in probe["hrefs"]:
+        # Prefer 'approve' link over 'reject' if both present
+        if "decision=approve" in href:
+            return href
+    if probe["hrefs"]:
         # Fallback to first script link
-        return links[0].get_attribute("href")
+        return probe["hrefs"][0]
 
     # Fallback: search body text for URL pattern
-    body_text = get_email_body_text(page)
-    match = re.search(r"https://script\.google\.com\S+", body_text)
+    match = _SCRIPT_URL_RE.search(probe["body"])
     return match.group(0) if match else None
 
 
@@ -17,7 +17,6 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from playwright.sync_api import BrowserContext, Page
 
-
 # ---------------------------------------------------------------------------
 # Navigation
 # ---------------------------------------------------------------------------
@@ -29,16 +28,22 @@ def open_sheet(context: BrowserContext, url: str, sheet_name: str) -> Page:
     """
     page = context.new_page()
     page.goto(url, wait_until="domcontentloaded")
-    page.wait_for_timeout(5000)
+    # Wait for the Name Box to attach instead of a flat 5s pause — it's the
+    # element every navigation helper drives, so it IS the readiness signal.
+    try:
+        page.wait_for_selector("#t-name-box, .waffle-name-box", timeout=20000)
+    except Exception:
+        page.wait_for_timeout(5000)
+    # Brief settle so the first paint of cell data completes
+    page.wait_for_timeout(1000)
 
-    # Dismiss any modal dialogs (e.g. "Some features have changed")
+    # Dismiss any modal dialogs (e.g. "Some features have changed") —
+    # the context init script removes overlays as they attach, so only
+    # the focus-stealing keyboard escapes remain here.
     page.keyboard.press("Escape")
     page.wait_for_timeout(500)
     page.keyboard.press("Escape")
     page.wait_for_timeout(500)
-    page.evaluate("document.querySelectorAll('.modal-dialog-bg').forEach(el => el.remove());")
-    page.evaluate("document.querySelectorAll('.modal-dialog').forEach(el => el.remove());")
-    page.evaluate("document.querySelectorAll('.picker.modal-dialog-bg').forEach(el => el.remove());")
 
     tab = page.locator(f"text={sheet_name}").first
     tab.click()
@@ -54,7 +59,6 @@ def goto_cell(page: Page, cell_ref: str) -> None:
     """
     page.keyboard.press("Escape")
     page.wait_for_timeout(200)
-    page.evaluate("document.querySelectorAll('.picker.modal-dialog-bg, .modal-dialog-bg, .modal-dialog').forEach(el => el.remove());")
 
     name_box = page.locator("#t-name-box").first
     if not name_box.is_visible():
@@ -1,36 +1,59 @@
-from playwright.sync_api import sync_playwright
-from conftest import PROFILE_DIR, AMAZON_FORM
+import sys
+
+from conftest import AMAZON_FORM
+from helpers.browser import close_context, get_playwright, launch_context
+from helpers.network import block_heavy_resources
+
+# Single evaluate() probe: one protocol round-trip instead of one per element.
+# Each inner_text()/get_attribute() call costs a full Python<->browser round-trip,
+# so looping over every heading/input/radio made this script crawl on big forms.
+PROBE_JS = """() => ({
+    headings: [...document.querySelectorAll("[role='heading']")]
+        .map(h => h.innerText.trim()),
+    inputs: [...document.querySelectorAll(
+            "input[type='text'], input[type='url'], input[type='number'], textarea")]
+        .map(el => ({
+            visible: el.offsetParent !== null,
+            type: el.type || el.tagName.toLowerCase(),
+            label: el.getAttribute('aria-label'),
+        })),
+    radios: [...document.querySelectorAll("[role='radio']")]
+        .filter(el => el.offsetParent !== null)
+        .map(el => ({
+            label: el.getAttribute('aria-label'),
+            value: el.getAttribute('data-value'),
+        })),
+})"""
 
 def run():
-    with sync_playwright() as pw:
-        context = pw.chromium.launch_persistent_context(
-            user_data_dir=PROFILE_DIR,
-            headless=False,
-            viewport={"width": 1280, "height": 900},
-        )
+    # Headless by default — this script only dumps text, and a headed
+    # Chrome window adds a couple seconds of startup. Pass --headed to
+    # watch it run.
+    context = launch_context(
+        get_playwright(), headless="--headed" not in sys.argv
+    )
+    try:
         page = context.new_page()
+        # Text-only probe — no reason to download the form's imagery
+        block_heavy_resources(page)
         page.goto(AMAZON_FORM, wait_until="domcontentloaded")
         page.wait_for_timeout(3000)
-        
-        # Get all question titles
-        headings = page.locator("[role='heading']").all()
-        for h in headings:
-            print("Question:", h.inner_text().strip())
-        
-        # Get all inputs
-        inputs = page.locator("input[type='text'], input[type='url'], input[type='number'], textarea").all()
-        print(f"Found {len(inputs)} visible text inputs")
-        for i, el in enumerate(inputs):
-            if el.is_visible():
-                print(f"Input {i}: type={el.evaluate('el => el.type')}, aria-label={el.get_attribute('aria-label')}")
-        
-        radios = page.locator("[role='radio']").all()
-        print(f"Found {len(radios)} radio buttons")
-        for r in radios:
-            if r.is_visible():
-                print("Radio:", r.get_attribute("aria-label"), r.get_attribute("data-value"))
-        
-        context.close()
+
+        data = page.evaluate(PROBE_JS)
+
+        for heading in data["headings"]:
+            print("Question:", heading)
+
+        print(f"Found {len(data['inputs'])} visible text inputs")
+        for i, inp in enumerate(data["inputs"]):
+            if inp["visible"]:
+                print(f"Input {i}: type={inp['type']}, aria-label={inp['label']}")
+
+        print(f"Found {len(data['radios'])} radio buttons")
+        for r in data["radios"]:
+            print("Radio:", r["label"], r["value"])
+    finally:
+        close_context(context)
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    run()
@@ -1,28 +1,35 @@
-from playwright.sync_api import sync_playwright
-from conftest import PROFILE_DIR, BUDGET_HUB
-import time
+from conftest import BUDGET_HUB
+from helpers.browser import close_context, get_playwright, launch_context
+from helpers.network import block_heavy_resources
+import sys
 import os
 
 def run():
     os.makedirs("evidence", exist_ok=True)
-    with sync_playwright() as pw:
-        context = pw.chromium.launch_persistent_context(
-            user_data_dir=PROFILE_DIR,
-            headless=False,
-            channel="chrome",
-            viewport={"width": 1280, "height": 900},
-            args=["--disable-blink-features=AutomationControlled"],
-        )
+    # Headless by default (text dump only); pass --headed to watch.
+    context = launch_context(
+        get_playwright(), headless="--headed" not in sys.argv
+    )
+    try:
         page = context.new_page()
+        # Text-only probe — no reason to download the grid's imagery
+        block_heavy_resources(page)
         page.goto(BUDGET_HUB, wait_until="domcontentloaded")
         page.wait_for_timeout(5000)
-        
-        # Print all inputs
-        inputs = page.locator("input").all()
+
+        # One evaluate() instead of 3 get_attribute round-trips per input —
+        # a Sheets page easily has dozens of inputs.
+        inputs = page.evaluate(
+            """() => [...document.querySelectorAll('input')].map(el => ({
+                id: el.id || null,
+                class: el.getAttribute('class'),
+                label: el.getAttribute('aria-label'),
+            }))"""
+        )
         for i, el in enumerate(inputs):
-            print(f"Input {i}: id={el.get_attribute('id')}, class={el.get_attribute('class')}, aria-label={el.get_attribute('aria-label')}")
-            
-        context.close()
+            print(f"Input {i}: id={el['id']}, class={el['class']}, aria-label={el['label']}")
+    finally:
+        close_context(context)
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    run()
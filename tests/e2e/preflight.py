@@ -22,8 +22,14 @@ from conftest import PROFILE_DIR, EVIDENCE_DIR, TARGET_EMAIL
 LIVE_ORDER_EMAIL = "mtrotter@keswickchristian.org"
 
 
-def check_safety() -> bool:
-    """Run all pre-flight safety checks. Returns True if safe to proceed."""
+def check_safety(context=None) -> bool:
+    """Run all pre-flight safety checks. Returns True if safe to proceed.
+
+    Args:
+        context: An already-launched BrowserContext to validate. When the
+            suite runner passes its own context, the separate launch/close
+            browser check (~2-3s) is skipped — the live context is proof.
+    """
     errors: list[str] = []
 
     # 1. Verify TARGET_EMAIL is not the live-order account
@@ -52,18 +58,22 @@ def check_safety() -> bool:
 
     # 4. Verify browser can open with persistent context
     if not errors:
-        try:
-            with sync_playwright() as pw:
-                ctx = pw.chromium.launch_persistent_context(
-                    user_data_dir=PROFILE_DIR,
-                    headless=False,
-                    viewport={"width": 1280, "height": 900},
-                )
-                if not ctx.pages:
-                    errors.append("Browser launched but no pages available")
-                ctx.close()
-        except Exception as e:
-            errors.append(f"Browser launch failed: {e}")
+        if context is not None:
+            if not context.pages:
+                errors.append("Shared browser context has no pages available")
+        else:
+            try:
+                with sync_playwright() as pw:
+                    ctx = pw.chromium.launch_persistent_context(
+                        user_data_dir=PROFILE_DIR,
+                        headless=False,
+                        viewport={"width": 1280, "height": 900},
+                    )
+                    if not ctx.pages:
+                        errors.append("Browser launched but no pages available")
+                    ctx.close()
+            except Exception as e:
+                errors.append(f"Browser launch failed: {e}")
 
     if errors:
         print("=" * 60)
@@ -1,18 +1,12 @@
-from playwright.sync_api import sync_playwright
-from conftest import PROFILE_DIR, BUDGET_HUB
+from conftest import BUDGET_HUB
+from helpers.browser import close_context, get_playwright, launch_context
 from helpers.sheets import open_sheet, set_cell, read_cell
 import time
 
 def run():
     print("Restoring Encumbrance Formula for Row 92...")
-    with sync_playwright() as pw:
-        context = pw.chromium.launch_persistent_context(
-            user_data_dir=PROFILE_DIR,
-            headless=False,
-            channel="chrome",
-            viewport={"width": 1280, "height": 900},
-            args=["--disable-blink-features=AutomationControlled"],
-        )
+    context = launch_context(get_playwright())
+    try:
         page = open_sheet(context, BUDGET_HUB, "UserDirectory")
         
         # The Encumbrance formula
@@ -29,8 +23,8 @@ def run():
         result = read_cell(page, "J92")
         print(f"Formula inserted successfully into J92.")
         print(f"New evaluated value is: {result}")
-        
-        context.close()
+    finally:
+        close_context(context)
 
 if __name__ == "__main__":
     run()
\ No newline at end of file
@@ -7,17 +7,15 @@ with sufficient budget is automatically approved without manual intervention.
 from __future__ import annotations
 
 import os
+import re
 import sys
-from playwright.sync_api import sync_playwright
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from conftest import (
-    PROFILE_DIR,
     BUDGET_HUB,
     AUTOMATED_HUB,
     AMAZON_FORM,
-    OWA_URL,
     TARGET_EMAIL,
     EVIDENCE_DIR,
 )
@@ -28,6 +26,10 @@ assert TARGET_EMAIL.lower().strip() != "mtrotter@keswickchristian.org", \
 from helpers.sheets import open_sheet, set_cell
 from helpers.owa import open_owa, search_emails, open_latest_email, get_email_body_text, delete_current_email
 from helpers.forms import open_form, fill_amazon_form, submit_form
+from helpers.browser import close_context, get_playwright, launch_context
+
+# One case-insensitive scan instead of two lower() copies of the email body
+_CONFIRMATION_RE = re.compile(r"approved|confirmation", re.IGNORECASE)
 
 
 def inject(context) -> None:
@@ -78,7 +80,7 @@ def verify(context) -> str:
     body = get_email_body_text(owa)
     owa.screenshot(path=os.path.join(EVIDENCE_DIR, "a1_email.png"))
 
-    if "approved" not in body.lower() and "confirmation" not in body.lower():
+    if not _CONFIRMATION_RE.search(body):
         result = "FAIL"
         details.append("Expected approval confirmation email not found")
 
@@ -88,22 +90,24 @@ def verify(context) -> str:
     return f"A1: {result}" + (f" — {'; '.join(details)}" if details else "")
 
 
-def run() -> str:
-    """Execute full A1 scenario."""
-    with sync_playwright() as pw:
-        context = pw.chromium.launch_persistent_context(
-            user_data_dir=PROFILE_DIR,
-            headless=False,
-            channel="chrome",
-            viewport={"width": 1280, "height": 900},
-            args=["--disable-blink-features=AutomationControlled"],
-        )
-        try:
-            inject(context)
-            execute(context)
-            return verify(context)
-        finally:
-            context.close()
+def run(context=None) -> str:
+    """Execute full A1 scenario.
+
+    When the suite runner passes an existing context, reuse it;
+    otherwise launch a standalone browser for this scenario only.
+    """
+    if context is not None:
+        inject(context)
+        execute(context)
+        return verify(context)
+    pw = get_playwright()
+    context = launch_context(pw)
+    try:
+        inject(context)
+        execute(context)
+        return verify(context)
+    finally:
+        close_context(context)
 
 
 if __name__ == "__main__":
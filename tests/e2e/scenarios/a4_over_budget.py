@@ -7,16 +7,14 @@ triggers an over-budget notification/approval request.
 from __future__ import annotations
 
 import os
+import re
 import sys
-from playwright.sync_api import sync_playwright
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from conftest import (
-    PROFILE_DIR,
     BUDGET_HUB,
     AMAZON_FORM,
-    OWA_URL,
     TARGET_EMAIL,
     EVIDENCE_DIR,
 )
@@ -34,6 +32,10 @@ from helpers.owa import (
     delete_current_email
 )
 from helpers.forms import open_form, fill_amazon_form, submit_form
+from helpers.browser import close_context, get_playwright, launch_context
+
+# One case-insensitive scan instead of two lower() copies of the email body
+_OVER_BUDGET_RE = re.compile(r"over budget|exceeds", re.IGNORECASE)
 
 
 def inject(context) -> None:
@@ -74,10 +76,10 @@ def verify(context) -> str:
 
     if owa.locator("div[role='option']").count() > 0:
         open_latest_email(owa)
-        body = get_email_body_text(owa).lower()
+        body = get_email_body_text(owa)
         owa.screenshot(path=os.path.join(EVIDENCE_DIR, "a4_email.png"))
         
-        if "over budget" not in body and "exceeds" not in body:
+        if not _OVER_BUDGET_RE.search(body):
             result = "FAIL"
             details.append("Email notification text did not mention over budget condition")
         
@@ -90,21 +92,24 @@ def verify(context) -> str:
     return f"A4: {result}" + (f" — {'; '.join(details)}" if details else "")
 
 
-def run() -> str:
-    with sync_playwright() as pw:
-        context = pw.chromium.launch_persistent_context(
-            user_data_dir=PROFILE_DIR,
-            headless=False,
-            channel="chrome",
-            viewport={"width": 1280, "height": 900},
-            args=["--disable-blink-features=AutomationControlled"],
-        )
-        try:
-            inject(context)
-            execute(context)
-            return verify(context)
-        finally:
-            context.close()
+def run(context=None) -> str:
+    """Execute the scenario.
+
+    When the suite runner passes an existing context, reuse it;
+    otherwise launch a standalone browser for this scenario only.
+    """
+    if context is not None:
+        inject(context)
+        execute(context)
+        return verify(context)
+    pw = get_playwright()
+    context = launch_context(pw)
+    try:
+        inject(context)
+        execute(context)
+        return verify(context)
+    finally:
+        close_context(context)
 
 
 if __name__ == "__main__":
@@ -7,15 +7,13 @@ Principal (TARGET_EMAIL) and requires a manual approval click.
 from __future__ import annotations
 
 import os
+import re
 import sys
-from playwright.sync_api import sync_playwright
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from conftest import (
-    PROFILE_DIR,
     BUDGET_HUB,
-    MANUAL_HUB,
     WAREHOUSE_FORM,
     TARGET_EMAIL,
     EVIDENCE_DIR,
@@ -30,10 +28,13 @@ from helpers.owa import (
     open_owa, 
     search_emails, 
     open_latest_email, 
-    click_approval_link,
-    delete_current_email
+    click_approval_link
 )
 from helpers.forms import open_form, fill_warehouse_form, submit_form
+from helpers.browser import close_context, get_playwright, launch_context
+
+# One case-insensitive scan instead of a lower() copy of the page text
+_APPROVED_RE = re.compile(r"approved", re.IGNORECASE)
 
 
 def inject(context) -> None:
@@ -73,8 +74,8 @@ def verify(context) -> str:
         owa.wait_for_timeout(5000)
         owa.screenshot(path=os.path.join(EVIDENCE_DIR, "c1_approval_landed.png"))
         
-        body_landed = owa.locator("body").inner_text().lower()
-        if "approved" not in body_landed:
+        body_landed = owa.locator("body").inner_text()
+        if not _APPROVED_RE.search(body_landed):
             result = "FAIL"
             details.append("Warehouse approval landing page failed")
     else:
@@ -85,21 +86,24 @@ def verify(context) -> str:
     return f"C1: {result}" + (f" — {'; '.join(details)}" if details else "")
 
 
-def run() -> str:
-    with sync_playwright() as pw:
-        context = pw.chromium.launch_persistent_context(
-            user_data_dir=PROFILE_DIR,
-            headless=False,
-            channel="chrome",
-            viewport={"width": 1280, "height": 900},
-            args=["--disable-blink-features=AutomationControlled"],
-        )
-        try:
-            inject(context)
-            execute(context)
-            return verify(context)
-        finally:
-            context.close()
+def run(context=None) -> str:
+    """Execute the scenario.
+
+    When the suite runner passes an existing context, reuse it;
+    otherwise launch a standalone browser for this scenario only.
+    """
+    if context is not None:
+        inject(context)
+        execute(context)
+        return verify(context)
+    pw = get_playwright()
+    context = launch_context(pw)
+    try:
+        inject(context)
+        execute(context)
+        return verify(context)
+    finally:
+        close_context(context)
 
 
 if __name__ == "__main__":
@@ -7,13 +7,12 @@ invoices are generated for approved transactions.
 from __future__ import annotations
 
 import os
+import re
 import sys
-from playwright.sync_api import sync_playwright
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from conftest import (
-    PROFILE_DIR,
     BUDGET_HUB,
     WEBAPP_URL,
     EVIDENCE_DIR,
@@ -21,17 +20,28 @@ from conftest import (
 
 from helpers.sheets import open_sheet, read_cell, find_row_by_value
 from scenarios.c1_warehouse import execute as run_c1_execute
+from helpers.browser import close_context, get_playwright, launch_context
+
+# Pulls the row number out of a Name Box reference like "K42"
+_ROW_NUM_RE = re.compile(r"\d+")
+
+# The WebApp's doGet runs the batch synchronously and only then returns a
+# result page, so any rendered body text means the batching has finished.
+_BATCH_DONE_JS = "() => document.body && document.body.innerText.trim().length > 0"
 
 
 def execute(context) -> None:
     """Run C1 to get an approved item, then trigger batch."""
     # Ensure there is at least one approved Warehouse item
     run_c1_execute(context)
-    
+
     # Trigger Warehouse Batch
     page = context.new_page()
     page.goto(f"{WEBAPP_URL}?action=runWarehouseBatch", wait_until="domcontentloaded")
-    page.wait_for_timeout(10000)
+    try:
+        page.wait_for_function(_BATCH_DONE_JS, timeout=15000)
+    except Exception:
+        pass  # verify() reads the ledger either way
     page.close()
 
 
@@ -51,8 +61,7 @@ def verify(context) -> str:
             name_box = page.locator(".waffle-name-box").first
             
         current_cell = name_box.input_value().upper()
-        import re
-        row_num = re.search(r"\d+", current_cell).group(0)
+        row_num = _ROW_NUM_RE.search(current_cell).group(0)
         
         gen_status = read_cell(page, f"K{row_num}")
         invoice_url = read_cell(page, f"L{row_num}")
@@ -75,20 +84,22 @@ def verify(context) -> str:
     return f"D2: {result}" + (f" — {'; '.join(details)}" if details else "")
 
 
-def run() -> str:
-    with sync_playwright() as pw:
-        context = pw.chromium.launch_persistent_context(
-            user_data_dir=PROFILE_DIR,
-            headless=False,
-            channel="chrome",
-            viewport={"width": 1280, "height": 900},
-            args=["--disable-blink-features=AutomationControlled"],
-        )
-        try:
-            execute(context)
-            return verify(context)
-        finally:
-            context.close()
+def run(context=None) -> str:
+    """Execute the scenario.
+
+    When the suite runner passes an existing context, reuse it;
+    otherwise launch a standalone browser for this scenario only.
+    """
+    if context is not None:
+        execute(context)
+        return verify(context)
+    pw = get_playwright()
+    context = launch_context(pw)
+    try:
+        execute(context)
+        return verify(context)
+    finally:
+        close_context(context)
 
 
 if __name__ == "__main__":
@@ -1,19 +1,20 @@
-from playwright.sync_api import sync_playwright
-from conftest import PROFILE_DIR, BUDGET_HUB
-import time
+"""Screenshot the Budget Hub UserDirectory tab for debugging.
+
+Captures the viewport only by default — a full-page PNG of a long sheet
+is several MB of encoding and disk I/O the usual debug loop never needs.
+Pass --full-page to capture the entire scrollable page.
+"""
+
+from conftest import BUDGET_HUB
+from helpers.browser import close_context, get_playwright, launch_context
 import os
+import sys
 
 def run():
     print("Opening browser to take a screenshot of Google Sheets...")
     os.makedirs("evidence", exist_ok=True)
-    with sync_playwright() as pw:
-        context = pw.chromium.launch_persistent_context(
-            user_data_dir=PROFILE_DIR,
-            headless=False,
-            channel="chrome",
-            viewport={"width": 1280, "height": 900},
-            args=["--disable-blink-features=AutomationControlled"],
-        )
+    context = launch_context(get_playwright())
+    try:
         page = context.new_page()
         page.goto(BUDGET_HUB, wait_until="domcontentloaded")
         page.wait_for_timeout(5000) # wait for data to load
@@ -24,10 +25,10 @@ def run():
 
         # Take a screenshot
         screenshot_path = "evidence/sheet_debug.png"
-        page.screenshot(path=screenshot_path, full_page=True)
+        page.screenshot(path=screenshot_path, full_page="--full-page" in sys.argv)
         print(f"Screenshot saved to {screenshot_path}")
-        
-        context.close()
+    finally:
+        close_context(context)
 
 if __name__ == "__main__":
     run()
\ No newline at end of file
@@ -1,40 +1,52 @@
-from playwright.sync_api import sync_playwright
-from conftest import PROFILE_DIR, BUDGET_HUB
+from conftest import BUDGET_HUB
+from helpers.browser import close_context, get_playwright, launch_context
 from helpers.sheets import open_sheet, goto_cell, read_cell
 import time
 
-def run():
+
+def run(context=None):
+    """Read-only Name Box navigation smoke test against Row 92.
+
+    When pytest (or a caller) passes an existing context, reuse it;
+    otherwise launch a standalone browser for this script only.
+    """
     print("Running read-only navigation test for Row 92...")
-    with sync_playwright() as pw:
-        context = pw.chromium.launch_persistent_context(
-            user_data_dir=PROFILE_DIR,
-            headless=False,
-            channel="chrome",
-            viewport={"width": 1280, "height": 900},
-            args=["--disable-blink-features=AutomationControlled"],
-        )
+    standalone = context is None
+    if standalone:
+        context = launch_context(get_playwright())
+    try:
         page = open_sheet(context, BUDGET_HUB, "UserDirectory")
-        
+
         # Navigate to A92 (Email) and read it
         goto_cell(page, "A92")
         time.sleep(2)  # Give you a second to visually confirm it jumped to A92
         email_val = read_cell(page, "A92")
         print(f"Cell A92 contains: {email_val}")
-        
+
         # Navigate to H92 (BudgetAllocated)
         goto_cell(page, "H92")
         time.sleep(2)
         alloc_val = read_cell(page, "H92")
         print(f"Cell H92 contains: {alloc_val}")
-        
+
         # Navigate to J92 (BudgetEncumbered)
         goto_cell(page, "J92")
         time.sleep(2)
         encumb_val = read_cell(page, "J92")
         print(f"Cell J92 contains: {encumb_val}")
 
-        print("Test complete. Browser closing.")
-        context.close()
+        print("Test complete.")
+        return email_val
+    finally:
+        if standalone:
+            close_context(context)
+
+
+def test_navigation(browser_context):
+    """Pytest entry point — rides the session-scoped shared context."""
+    email_val = run(browser_context)
+    assert email_val, "Cell A92 (Email) read back empty"
+
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    run()